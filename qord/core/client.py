@@ -40,9 +40,15 @@ from qord.events.base import BaseEvent
 import asyncio
 import inspect
 import logging
+import sys
 import traceback
 import typing
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 if typing.TYPE_CHECKING:
     from aiohttp import ClientSession
     from qord.models.users import ClientUser
@@ -118,6 +124,17 @@ class Client:
     cache: :class:`ClientCache`
         The cache handler to use for the client. If not provided, Defaults to
         :class:`DefaultClientCache`.
+    loop_factory: Callable[[], :class:`asyncio.AbstractEventLoop`]
+        The callable used by :meth:`.start` to create the event loop. If not provided
+        and `uvloop <https://github.com/MagicStack/uvloop>`_ is installed, ``uvloop.new_event_loop``
+        is used otherwise the default asyncio event loop is used. This has no effect
+        when the client is started using :meth:`.setup` and :meth:`.launch`.
+
+        This parameter requires Python 3.10 or higher. On older versions, uvloop
+        is also not used by default.
+
+        On Python 3.12+, :meth:`.start` runs the loop with :func:`asyncio.eager_task_factory`
+        unless the loop already has a custom task factory set.
     """
     if typing.TYPE_CHECKING:
         _event_listeners: typing.Dict[str, typing.List[EventListener]]
@@ -134,12 +151,17 @@ class Client:
         debug_events: bool = False,
         connect_timeout: float = 5.0,
         ready_timeout: float = 2.0,
+        loop_factory: typing.Optional[typing.Callable[[], asyncio.AbstractEventLoop]] = None,
     ) -> None:
 
         if shards_count is not None and shards_count < 1:
             raise ValueError("Parameter shards_count must be an integer greater then or equal to 1.")
         if cache is not None and not isinstance(cache, ClientCache):
             raise TypeError("Parameter cache must be an instance of ClientCache. Not %r" % cache.__class__)
+        if loop_factory is not None and sys.version_info < (3, 10):
+            # Before 3.10, asyncio primitives created below are bound to the
+            # current event loop and cannot be used with another loop.
+            raise ValueError("Parameter loop_factory requires Python 3.10 or higher.")
 
         self._rest: RestClient = RestClient(
             session=session,
@@ -160,6 +182,7 @@ class Client:
         self._cache.clear()
 
         self.connect_timeout = connect_timeout
+        self.loop_factory = loop_factory
         self.intents = intents or Intents.unprivileged()
 
         # Following are set during setup()
@@ -341,6 +364,23 @@ class Client:
         """
         return self._event_listeners.get(event_name, [])
 
+    def has_listeners(self, event_name: str, /) -> bool:
+        """Checks whether the provided event has any listeners or waiters.
+
+        This takes both the registered event listeners and the pending
+        :meth:`.wait_for_event` calls into account.
+
+        Parameters
+        ----------
+        event_name: :class:`builtins.str`
+            The name of event to check listeners for.
+
+        Returns
+        -------
+        :class:`builtins.bool`
+        """
+        return bool(self._event_listeners.get(event_name) or self._event_futures.get(event_name))
+
     def clear_event_listeners(self, event_name: str, /) -> typing.List[EventListener]:
         """Clears all events listener for the provided event.
 
@@ -489,20 +529,29 @@ class Client:
 
         loop = asyncio.get_running_loop()
 
-        listeners = self._event_listeners.get(event_name, [])
-        for listener in listeners:
-            loop.create_task(self._wrapped_callable(listener, event))
-
-        futures = self._event_futures.get(event_name, [])
-        for tup in futures:
-            check, future = tup
-            if check(event):
-                if not future.done():
-                    future.set_result(event)
-                try:
-                    futures.remove(tup)
-                except ValueError:
-                    pass
+        # Both lists are copied before the listeners are scheduled. With eager
+        # tasks, listeners may run up to their first await right away and register
+        # new waiters or listeners for this event, which must not receive the
+        # current event. Listeners are scheduled first so that a failing waiter
+        # check doesn't prevent them from being called.
+        futures = self._event_futures.get(event_name)
+        waiters = futures.copy() if futures else None
+
+        listeners = self._event_listeners.get(event_name)
+        if listeners:
+            for listener in listeners.copy():
+                loop.create_task(self._wrapped_callable(listener, event))
+
+        if waiters:
+            for tup in waiters:
+                check, future = tup
+                if check(event):
+                    if not future.done():
+                        future.set_result(event)
+                    try:
+                        futures.remove(tup) # type: ignore
+                    except ValueError:
+                        pass
 
     def event(self, event_name: str, /) -> typing.Callable[[EventListener], EventListener]:
         """A decorator that registers an event listener for provided event.
@@ -712,10 +761,24 @@ class Client:
             await self.setup(token)
             await self.launch()
 
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
+        loop_factory = self.loop_factory
+
+        if loop_factory is None and uvloop is not None and sys.version_info >= (3, 10):
+            loop_factory = uvloop.new_event_loop
+
+        if loop_factory is not None:
+            loop = loop_factory()
+        else:
+            try:
+                loop = asyncio.get_event_loop()
+            except RuntimeError:
+                loop = asyncio.new_event_loop()
+
+        # On Python 3.12+, tasks are started eagerly so that the event
+        # listeners and other tasks that complete without suspending
+        # don't have to roundtrip through the event loop's scheduler.
+        if hasattr(asyncio, "eager_task_factory") and loop.get_task_factory() is None:
+            loop.set_task_factory(asyncio.eager_task_factory) # type: ignore
 
         try:
             loop.run_until_complete(launcher())
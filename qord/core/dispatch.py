@@ -39,7 +39,6 @@ from qord import events
 from datetime import datetime
 import asyncio
 import copy
-import inspect
 import logging
 import typing
 
@@ -61,41 +60,69 @@ def event_dispatch_handler(name: str):
 
     return _wrap
 
+def _collect_handlers(cls: typing.Type[DispatchHandler]) -> typing.List[typing.Tuple[str, str]]:
+    # Walk the MRO in reverse so that handlers overridden in subclasses
+    # take precedence over the ones defined in parent classes.
+    handlers = {}
+
+    for klass in reversed(cls.__mro__):
+        for attr, value in vars(klass).items():
+            try:
+                handlers[value.__handler_event__] = attr
+            except AttributeError:
+                pass
+
+    return list(handlers.items())
+
 class DispatchHandler:
     r"""Internal class that handles gateway events dispatches."""
 
+    # [(event_name, function_name)], built when the class is created.
+    _handler_registry: typing.List[typing.Tuple[str, str]]
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        cls._handler_registry = _collect_handlers(cls)
+
     def __init__(self, client: Client, ready_timeout: float = 2.0, debug_events: bool = False) -> None:
+        from qord.core.client import Client # HACK: circular imports
+
         self.client = client
         self.ready_timeout = ready_timeout
         self.debug_events = debug_events
         self.cache = client._cache
-        self.invoke = client.invoke_event
+        self._invoke = client.invoke_event
+        self._has_listeners = client.has_listeners
+
+        # If invoke_event() is overridden e.g for logging or forwarding the
+        # events, all events are passed to it regardless of listeners.
+        self._skip_unlistened = type(client).invoke_event is Client.invoke_event
+
         self._shards_connected = asyncio.Event()
         self._shards_ready = asyncio.Event()
-        self._guild_create_waiter = None
+        self._last_guild_create = 0.0
         self._ready_task = None
         self._update_handlers()
 
-    def _update_handlers(self):
-        self._handlers = {}
-        members = inspect.getmembers(self)
+    def invoke(self, event: events.BaseEvent) -> None:
+        # Most of the events have no listeners or waiters registered
+        # so skip invoking them entirely in that case.
+        if self._skip_unlistened and not self._has_listeners(event.__event_name__):
+            return
 
-        for _, member in members:
-            try:
-                self._handlers[member.__handler_event__] = member
-            except AttributeError:
-                pass
+        self._invoke(event)
+
+    def _update_handlers(self):
+        self._handlers = {name: getattr(self, func_name) for name, func_name in self._handler_registry}
 
     async def handle(self, shard: Shard, title: str, data: typing.Any) -> None:
+        handler = self._handlers.get(title)
+
         if self.debug_events:
             event = events.GatewayDispatch(shard=shard, title=title, data=data)
             self.invoke(event)
 
-        try:
-            handler = self._handlers[title]
-        except KeyError:
-            return
-        else:
+        if handler is not None:
             await handler(shard, data)
 
     async def _prepare_ready(self, shard: typing.Optional[Shard] = None):
@@ -108,15 +135,19 @@ class DispatchHandler:
             # guilds so wait for all the shards to connect first.
             await self._shards_connected.wait()
 
+        # Rather than waiting on a new future for each GUILD_CREATE, only the time
+        # of last received GUILD_CREATE is tracked and we sleep until that time
+        # is older than the timeout.
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+
         while True:
-            self._guild_create_waiter = asyncio.Future()
-            try:
-                await asyncio.wait_for(self._guild_create_waiter, timeout=timeout)
-            except asyncio.TimeoutError:
+            last_guild_create = max(self._last_guild_create, started_at)
+            delay = last_guild_create + timeout - loop.time()
+            if delay <= 0:
                 break
+            await asyncio.sleep(delay)
 
-        # Do some cleanup and invoke the ready event
-        self._guild_create_waiter = None
         event = events.Ready() if shard is None else events.ShardReady(shard=shard)
         self.invoke(event)
 
@@ -177,11 +208,8 @@ class DispatchHandler:
         guild = Guild(data, client=self.client, enable_cache=True)
         self.cache.add_guild(guild)
 
-        # Notify waiters for dispatching ready event
-        waiter = self._guild_create_waiter
-
-        if waiter and not waiter.done():
-            waiter.set_result(guild)
+        # Delays the ready event dispatch, see _prepare_ready()
+        self._last_guild_create = asyncio.get_running_loop().time()
 
         # unavailable being False means that an unavailable guild
         # either because of outage or from READY event has became available.
@@ -331,6 +359,8 @@ class DispatchHandler:
             return
 
         before = copy.copy(member)
+        # The user is updated in place so keep a copy of it as well.
+        before.user = copy.copy(member.user)
         member._update_with_data(data)
 
         event = events.GuildMemberUpdate(shard=shard, guild=guild, before=before, after=member)
@@ -1012,3 +1042,5 @@ class DispatchHandler:
         )
         self.invoke(event)
 
+
+DispatchHandler._handler_registry = _collect_handlers(DispatchHandler)
@@ -35,7 +35,7 @@ REST_BASE_URL = "https://discord.com/api/v10"
 
 
 class Route:
-    __slots__ = ("method", "path", "requires_auth", "params")
+    __slots__ = ("method", "path", "requires_auth", "params", "_url", "_ratelimit_path")
 
     def __init__(self,
         method: typing.Literal["GET", "POST", "PUT", "DELETE", "PATCH"],
@@ -50,16 +50,24 @@ class Route:
         self.requires_auth = requires_auth
         self.params = params
 
+        # The parameters don't change after construction so both of these
+        # are computed once here rather than on every access.
+        self._url = REST_BASE_URL + path.format_map(params)
+        guild_id = params.get("guild_id")
+        channel_id = params.get("channel_id")
+
+        if guild_id is None and channel_id is None:
+            self._ratelimit_path = f"{method}-{path}"
+        else:
+            self._ratelimit_path = f"{method}-{path}-{guild_id}:{channel_id}"
+
     @property
     def url(self) -> str:
-        return REST_BASE_URL + self.path.format_map(self.params)
+        return self._url
 
     @property
     def ratelimit_path(self) -> str:
-        params = self.params
-        guild_id = params.get("guild_id")
-        channel_id = params.get("channel_id")
-        return f"{self.method}-{self.path}-{guild_id}:{channel_id}"
+        return self._ratelimit_path
 
     def __repr__(self) -> str:
         return f"{self.method} {self.url}"
@@ -71,57 +79,63 @@ class RatelimitHandler:
         self.global_ratelimit_cleared = asyncio.Event()
         self.global_ratelimit_cleared.set()
 
-        # { bucket_hash | ratelimit_path : asyncio.Lock }
-        self.locks: typing.Dict[str, asyncio.Lock] = {}
+        # Checked before waiting on the event above so that requests
+        # don't wait on the event when there is no global ratelimit.
+        self._global_cleared = True
+
+        # { ratelimit_path : [bucket_hash | None, asyncio.Lock] }
+        self._entries: typing.Dict[str, typing.List[typing.Any]] = {}
 
-        # { ratelimit_path : bucket_hash }
-        self.buckets: typing.Dict[str, str] = {}
+        # { bucket_hash : asyncio.Lock }
+        # Only used for sharing a lock between routes having same bucket hash.
+        self._bucket_locks: typing.Dict[str, asyncio.Lock] = {}
 
     def clear(self) -> None:
         """Clears internal ratelimit data including locks and bucket hashes."""
-        self.locks.clear()
-        self.buckets.clear()
+        self._entries.clear()
+        self._bucket_locks.clear()
 
     def set_global(self) -> None:
         """Sets the global ratelimit, preventing any HTTP requests."""
+        self._global_cleared = False
         self.global_ratelimit_cleared.clear()
 
     def reset_global(self) -> None:
         """Resets the global ratelimit, awakening the waiter coroutines."""
+        self._global_cleared = True
         self.global_ratelimit_cleared.set()
 
     async def wait_until_global_reset(self) -> None:
         """Blocks until global ratelimit is cleared."""
+        if self._global_cleared:
+            return
         await self.global_ratelimit_cleared.wait()
 
     def get_lock(self, path: str) -> asyncio.Lock:
         """Gets the asyncio.Lock instance for given route's path."""
+        entry = self._entries.get(path)
 
-        # Firstly, try to retrieve the bucket hash for this path.
-        key = self.buckets.get(path)
-
-        if key is None:
-            # Bucket hash not found, As a workaround, we will be falling
-            # back to storing lock with the route's path.
-            key = path
+        if entry is None:
+            # Bucket hash is not known yet, the lock is tied to route's path
+            # until set_bucket() is called for this path.
+            self._entries[path] = entry = [None, asyncio.Lock()]
 
-        try:
-            return self.locks[key]
-        except KeyError:
-            self.locks[key] = lock = asyncio.Lock()
-            return lock
+        return entry[1]
 
     def set_bucket(self, path: str, bucket: str) -> None:
         """Stores the bucket hash for the given route's path."""
+        entry = self._entries.get(path)
 
-        # If we have a "fallback" lock stored in the locks mapping with
-        # the route's path, We want to store that lock with the bucket hash
-        # as key and remove the route's path from the mapping.
-        try:
-            lock = self.locks.pop(path)
-        except KeyError:
-            pass
-        else:
-            self.locks[bucket] = lock
+        if entry is None:
+            self._entries[path] = [bucket, self._bucket_locks.setdefault(bucket, asyncio.Lock())]
+            return
+
+        if entry[0] == bucket:
+            # Most common case, bucket hash is already known.
+            return
 
-        self.buckets[path] = bucket
+        # Bucket hash is received for the first time or has changed. If another
+        # route shares this bucket, use the lock of that route otherwise the
+        # current lock of this path becomes the bucket's lock.
+        entry[0] = bucket
+        entry[1] = self._bucket_locks.setdefault(bucket, entry[1])
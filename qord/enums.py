@@ -22,8 +22,47 @@
 
 from __future__ import annotations
 
-
-class GatewayEvent:
+from enum import IntEnum
+import sys
+import typing
+
+if sys.version_info >= (3, 11):
+    from enum import StrEnum as _StrEnum
+else:
+    from enum import Enum
+
+    class _StrEnum(str, Enum):
+        # Backport of enum.StrEnum's behaviour of str() and format()
+        # returning the member's value.
+        __str__ = str.__str__
+        __format__ = str.__format__
+
+__all__ = (
+    "GatewayEvent",
+    "PremiumType",
+    "DefaultAvatar",
+    "ImageExtension",
+    "VerificationLevel",
+    "NotificationLevel",
+    "ExplicitContentFilter",
+    "NSFWLevel",
+    "PremiumTier",
+    "MFALevel",
+    "ChannelType",
+    "VideoQualityMode",
+    "MessageType",
+    "TimestampStyle",
+    "ChannelPermissionType",
+    "EventPrivacyLevel",
+    "EventEntityType",
+    "EventStatus",
+    "StagePrivacyLevel",
+    "TeamMembershipState",
+    "InviteTargetType",
+)
+
+
+class GatewayEvent(_StrEnum):
     """An enumeration that details names of various events sent over gateway.
 
     These events names are commonly passed in :class:`Client.event` decorator for
@@ -151,7 +190,7 @@ class GatewayEvent:
     """Called whenever an invite is deleted. See :class:`events.InviteDelete` for more info."""
 
 
-class PremiumType:
+class PremiumType(IntEnum):
     """An enumeration that details values for a user's premium aka nitro subscription.
 
     Most common place where this enumeration is useful is when working with the
@@ -168,7 +207,7 @@ class PremiumType:
     """User has nitro subscription."""
 
 
-class DefaultAvatar:
+class DefaultAvatar(IntEnum):
     """An enumeration that details values for a user's default avatar.
 
     A user's default avatar value is calculated on the basis of user's
@@ -198,15 +237,22 @@ class DefaultAvatar:
     PINK = 5
     """Pink coloured default avatar."""
 
-    INDEX = 5
+    # INDEX is not a member since it would otherwise be an alias of PINK
+    # having the same value. It is set on the class below instead.
+    INDEX: typing.ClassVar[int]
     """The zero based index integer used for generating the user's default avatar.
 
     This is based of number of colours available for default avatars.
     As such, If Discord adds a new avatar colour, This index will increment.
+
+    Unlike other attributes, This is a plain integer and not an enumeration member.
     """
 
 
-class ImageExtension:
+DefaultAvatar.INDEX = 5 # type: ignore
+
+
+class ImageExtension(_StrEnum):
     """An enumeration that details values for a various image extensions supported
     on the Discord CDN URLs.
     """
@@ -227,7 +273,7 @@ class ImageExtension:
     """GIF extension. This is only supported for animated image resources."""
 
 
-class VerificationLevel:
+class VerificationLevel(IntEnum):
     """An enumeration that details values for a :class:`Guild`'s :attr:`~Guild.verification_level`
 
     Verification level defines the requirements for a user account to be member of the guild.
@@ -249,7 +295,7 @@ class VerificationLevel:
     """Users must also have a verified phone number bound to their account."""
 
 
-class NotificationLevel:
+class NotificationLevel(IntEnum):
     """An enumeration that details values for a :class:`Guild`'s :attr:`~Guild.notification_level`
 
     Notification level defines the levels of notifications that the members of the
@@ -263,7 +309,7 @@ class NotificationLevel:
     """Members will receive notifications for only messages that mentions them."""
 
 
-class ExplicitContentFilter:
+class ExplicitContentFilter(IntEnum):
     """An enumeration that details values for a :class:`Guild`'s :attr:`~Guild.explicit_content_filter`
 
     Explicit content filter defines the explicit content checks and filters done on the files
@@ -280,7 +326,7 @@ class ExplicitContentFilter:
     """Scanning will be done for all messages."""
 
 
-class NSFWLevel:
+class NSFWLevel(IntEnum):
     """An enumeration that details values for a :class:`Guild`'s :attr:`~Guild.nsfw_level`
 
     NSFW level defines whether the guild is marked as Not Safe For Work (NSFW) or
@@ -300,7 +346,7 @@ class NSFWLevel:
     """Guild is marked as age restricted."""
 
 
-class PremiumTier:
+class PremiumTier(IntEnum):
     """An enumeration that details values for a :class:`Guild`'s :attr:`~Guild.premium_tier`
 
     Premium tier defines the server boosts level of the guild.
@@ -319,7 +365,7 @@ class PremiumTier:
     """Guild has unlocked boost level 3 perks."""
 
 
-class MFALevel:
+class MFALevel(IntEnum):
     """An enumeration that details values for a :class:`Guild`'s :attr:`~Guild.mfa_level`
 
     MFA level defines the 2 factor authentication requirement for the guild moderators
@@ -333,7 +379,7 @@ class MFALevel:
     """2FA is required for performing moderative actions.."""
 
 
-class ChannelType:
+class ChannelType(IntEnum):
     """An enumeration that details the types of channels."""
 
     TEXT = 0
@@ -370,7 +416,7 @@ class ChannelType:
     """The channel is a guild's stage channel."""
 
 
-class VideoQualityMode:
+class VideoQualityMode(IntEnum):
     """An enumeration that details the video quality mode of a :class:`VoiceChannel`."""
 
     AUTO = 1
@@ -380,7 +426,7 @@ class VideoQualityMode:
     """720p quality."""
 
 
-class MessageType:
+class MessageType(IntEnum):
     """An enumeration that details the type of a :class:`Message`."""
 
     DEFAULT = 0
@@ -453,7 +499,7 @@ class MessageType:
     """Message is a context menu command."""
 
 
-class TimestampStyle:
+class TimestampStyle(_StrEnum):
     """An enumeration that details all styles for a markdown timestamp."""
 
     SHORT_TIME = "t"
@@ -482,7 +528,7 @@ class TimestampStyle:
     """Relative time e.g 2 months ago"""
 
 
-class ChannelPermissionType:
+class ChannelPermissionType(IntEnum):
     """An enumeration that details type of target in a :class:`ChannelPermission` object."""
 
     ROLE = 0
@@ -492,14 +538,14 @@ class ChannelPermissionType:
     """Overwrite belonging to a guild member."""
 
 
-class EventPrivacyLevel:
+class EventPrivacyLevel(IntEnum):
     """An enumeration that details privacy level of a :class:`ScheduledEvent`."""
 
     GUILD_ONLY = 2
     """The event is available guild members only."""
 
 
-class EventEntityType:
+class EventEntityType(IntEnum):
     """An enumeration that details entity types of a :class:`ScheduledEvent`."""
 
     STAGE_INSTANCE = 1
@@ -512,7 +558,7 @@ class EventEntityType:
     """The event is happening externally."""
 
 
-class EventStatus:
+class EventStatus(IntEnum):
     """An enumeration that details status of a :class:`ScheduledEvent`"""
 
     SCHEDULED = 1
@@ -524,18 +570,18 @@ class EventStatus:
     COMPLETED = 3
     """The event has finished."""
 
-    CANCELED = 3
+    CANCELED = 4
     """The event was cancelled."""
 
 
-class StagePrivacyLevel:
+class StagePrivacyLevel(IntEnum):
     """An enumeration that details privacy level of a :class:`StageInstance`."""
 
     GUILD_ONLY = 2
     """The stage instance is available guild members only."""
 
 
-class TeamMembershipState:
+class TeamMembershipState(IntEnum):
     """An enumeration that details the membership state of a :class:`TeamMember`"""
 
     INVITED = 1
@@ -545,7 +591,7 @@ class TeamMembershipState:
     """The member has accepted the invite and is part of team."""
 
 
-class InviteTargetType:
+class InviteTargetType(IntEnum):
     """An enumeration that details the target type of an :class:`Invite`"""
 
     STREAM = 1
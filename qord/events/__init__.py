@@ -6,15 +6,117 @@ Data classes that detail events.
 """
 
 from qord.events.base import *
-from qord.events.channels import *
-from qord.events.gateway import *
-from qord.events.guild_members import *
-from qord.events.guilds import *
-from qord.events.roles import *
-from qord.events.messages import *
-from qord.events.users import *
-from qord.events.emojis import *
-from qord.events.reactions import *
-from qord.events.scheduled_events import *
-from qord.events.stage_instances import *
-from qord.events.invites import *
+
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from qord.events.channels import *
+    from qord.events.gateway import *
+    from qord.events.guild_members import *
+    from qord.events.guilds import *
+    from qord.events.roles import *
+    from qord.events.messages import *
+    from qord.events.users import *
+    from qord.events.emojis import *
+    from qord.events.reactions import *
+    from qord.events.scheduled_events import *
+    from qord.events.stage_instances import *
+    from qord.events.invites import *
+
+
+# The events submodules are only imported when one of their
+# events is accessed for the first time. See PEP 562.
+_LAZY_EVENTS = {
+    "channels": (
+        "ChannelCreate",
+        "ChannelUpdate",
+        "ChannelDelete",
+        "ChannelPinsUpdate",
+        "TypingStart",
+    ),
+    "gateway": (
+        "GatewayDispatch",
+        "ShardReady",
+        "Ready",
+        "Resumed",
+    ),
+    "guild_members": (
+        "GuildMemberAdd",
+        "GuildMemberUpdate",
+        "GuildMemberRemove",
+    ),
+    "guilds": (
+        "GuildAvailable",
+        "GuildUnavailable",
+        "GuildJoin",
+        "GuildUpdate",
+        "GuildLeave",
+    ),
+    "roles": (
+        "RoleCreate",
+        "RoleUpdate",
+        "RoleDelete",
+    ),
+    "messages": (
+        "MessageCreate",
+        "MessageDelete",
+        "MessageUpdate",
+        "MessageBulkDelete",
+    ),
+    "users": (
+        "UserUpdate",
+    ),
+    "emojis": (
+        "EmojisUpdate",
+    ),
+    "reactions": (
+        "ReactionAdd",
+        "ReactionRemove",
+        "ReactionClear",
+        "ReactionClearEmoji",
+    ),
+    "scheduled_events": (
+        "ScheduledEventCreate",
+        "ScheduledEventUpdate",
+        "ScheduledEventDelete",
+        "ScheduledEventUserAdd",
+        "ScheduledEventUserRemove",
+    ),
+    "stage_instances": (
+        "StageInstanceCreate",
+        "StageInstanceUpdate",
+        "StageInstanceDelete",
+    ),
+    "invites": (
+        "InviteCreate",
+        "InviteDelete",
+    ),
+}
+
+_EVENTS_MODULES = {
+    name: module
+    for module, names in _LAZY_EVENTS.items()
+    for name in names
+}
+
+__all__ = (
+    "BaseEvent",
+    "BaseGatewayEvent",
+    *_EVENTS_MODULES,
+)
+
+
+def __getattr__(name: str) -> typing.Any:
+    try:
+        module = _EVENTS_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return list(__all__)
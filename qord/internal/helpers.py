@@ -100,6 +100,9 @@ def get_image_data(img_bytes: bytes) -> str:
 
 def parse_iso_timestamp(timestamp: str) -> datetime:
     """Parse ISO timestamp string to a datetime.datetime instance."""
+    if timestamp.endswith("Z"):
+        # datetime.fromisoformat() only supports the "Z" suffix on 3.11+
+        timestamp = timestamp[:-1] + "+00:00"
     return datetime.fromisoformat(timestamp)
 
 def compute_creation_time(snowflake: int) -> datetime:
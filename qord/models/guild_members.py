@@ -30,6 +30,8 @@ from qord.internal.mixins import Comparable
 from qord.flags.permissions import Permissions
 
 from datetime import datetime
+import sys
+import time
 import typing
 
 if typing.TYPE_CHECKING:
@@ -44,6 +46,14 @@ __all__ = (
 )
 
 
+if sys.version_info >= (3, 11):
+    # Avoid the wrapper's overhead when fromisoformat() natively supports the
+    # timestamps format sent by Discord. Members are parsed in bulk so this matters.
+    _parse_timestamp = datetime.fromisoformat
+else:
+    _parse_timestamp = parse_iso_timestamp
+
+
 def _user_features(cls):
     ignore = (
         "avatar",
@@ -118,11 +128,6 @@ class GuildMember(BaseModel, Comparable):
         Whether the member is muted in voice channels.
     pending: :class:`builtins.bool`
         Whether the member has passed the membership screening.
-    joined_at: :class:`datetime.datetime`
-        The time when member joined the guild.
-    premium_since: Optional[:class:`datetime.datetime`]
-        The time when member started boosting the guild if applicable. If member
-        is not boosting the guild, This is ``None``.
     timeout_until: Optional[:class:`datetime.datetime`]
         The time until which member is timed out and cannot interact with
         the guild. If member is not timed out, This is ``None``.
@@ -132,10 +137,8 @@ class GuildMember(BaseModel, Comparable):
             timed out. In which case, The datetime object would be in past. See
             :meth:`.is_timed_out` check that covers all possible cases.
 
-    role_ids: List[:class:`builtins.int`]
-        The list of IDs of roles that are associated to this member.
-    roles: List[:class:`Role`]
-        The list of roles associated to this member.
+    role_ids: Tuple[:class:`builtins.int`, ...]
+        The IDs of roles that are associated to this member.
     """
     if typing.TYPE_CHECKING:
         # -- Member properties --
@@ -146,11 +149,11 @@ class GuildMember(BaseModel, Comparable):
         deaf: bool
         mute: bool
         pending: bool
-        joined_at: datetime
-        premium_since: typing.Optional[datetime]
         timeout_until: typing.Optional[datetime]
-        role_ids: typing.List[int]
-        roles: typing.List[Role]
+        role_ids: typing.Tuple[int, ...]
+        _joined_at: typing.Union[str, datetime]
+        _premium_since: typing.Union[str, datetime, None]
+        _timeout_until_ts: float
 
         # -- User properties (applied by _user_features decorator) --
         id: int
@@ -174,43 +177,102 @@ class GuildMember(BaseModel, Comparable):
         send = User.send
 
     __slots__ = ("guild", "_client", "user", "nickname", "guild_avatar", "deaf", "mute", "pending",
-                "joined_at", "premium_since", "timeout_until", "role_ids", "roles")
+                "_joined_at", "_premium_since", "timeout_until", "role_ids", "_timeout_until_ts")
 
     def __init__(self, data: typing.Dict[str, typing.Any], guild: Guild) -> None:
         self.guild = guild
         self._client = guild._client
+
+        # The join time of a member never changes so unlike other
+        # fields, this is not updated again on member updates.
+        self._joined_at = data["joined_at"]
         self._update_with_data(data)
 
     def _update_with_data(self, data: typing.Dict[str, typing.Any]) -> None:
-        self.user = User(data["user"], client=self._client)
-        self.nickname = data.get("nick")
-        self.guild_avatar = data.get("avatar")
-        self.deaf = data.get("deaf", False)
-        self.mute = data.get("mute", False)
-        self.pending = data.get("pending", False)
-
-        premium_since = data.get("premium_since")
-        timeout_until = data.get("communication_disabled_until")
-
-        self.joined_at = parse_iso_timestamp(data["joined_at"])
-        self.premium_since = parse_iso_timestamp(premium_since) if premium_since is not None else None
-        self.timeout_until = parse_iso_timestamp(timeout_until) if timeout_until is not None else None
-
-        role_ids = [int(role_id) for role_id in data.get("roles", [])]
-        roles = []
-        guild = self.guild
+        # Members are parsed in bulk (GUILD_CREATE, GUILD_MEMBERS_CHUNK etc.)
+        # so the dict.get method is only looked up once here.
+        get = data.get
+
+        # Members of different guilds share the same user so the cached
+        # user is reused (and refreshed) rather than creating a new one.
+        user_data = data["user"]
+        client = self._client
+        user = client._cache.get_user(int(user_data["id"]))
+
+        if user is None:
+            user = User(user_data, client=client)
+        elif user is not client._user:
+            # Member payloads don't include the private fields of client
+            # user so only update the other users.
+            user._update_with_data(user_data)
+
+        self.user = user
+        self.nickname = get("nick")
+        self.guild_avatar = get("avatar")
+        self.deaf = get("deaf", False)
+        self.mute = get("mute", False)
+        self.pending = get("pending", False)
+
+        # The ISO timestamps are only parsed (once) upon accessing the relevant
+        # properties. timeout_until is the exception as it is required
+        # for is_timed_out() check and is rarely present anyway.
+        self._premium_since = get("premium_since")
+        timeout_until = get("communication_disabled_until")
+
+        if timeout_until is not None:
+            self.timeout_until = timeout_until = _parse_timestamp(timeout_until)
+            self._timeout_until_ts = timeout_until.timestamp()
+        else:
+            self.timeout_until = None
+            self._timeout_until_ts = 0.0
+
+        self.role_ids = tuple([int(role_id) for role_id in get("roles", ())])
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(id={self.id}, nickname={self.nickname})"
 
-        for role_id in role_ids:
-            role = guild.cache.get_role(role_id)
+    @property
+    def joined_at(self) -> datetime:
+        """The time when member joined the guild.
 
-            if role is not None:
-                roles.append(role)
+        Returns
+        -------
+        :class:`datetime.datetime`
+        """
+        joined_at = self._joined_at
+        if isinstance(joined_at, str):
+            # Replace the raw timestamp with parsed one on first access.
+            self._joined_at = joined_at = _parse_timestamp(joined_at)
+        return joined_at
 
-        self.role_ids = role_ids
-        self.roles = roles
+    @property
+    def premium_since(self) -> typing.Optional[datetime]:
+        """The time when member started boosting the guild if applicable.
 
-    def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(id={self.id}, nickname={self.nickname})"
+        If member is not boosting the guild, This is ``None``.
+
+        Returns
+        -------
+        Optional[:class:`datetime.datetime`]
+        """
+        premium_since = self._premium_since
+        if isinstance(premium_since, str):
+            self._premium_since = premium_since = _parse_timestamp(premium_since)
+        return premium_since
+
+    @property
+    def roles(self) -> typing.List[Role]:
+        """The list of roles associated to this member.
+
+        The roles are resolved from the guild's cache using :attr:`.role_ids`
+        upon access. Roles that are not found in cache are not included.
+
+        Returns
+        -------
+        List[:class:`Role`]
+        """
+        get_role = self.guild._cache.get_role
+        return [role for role in map(get_role, self.role_ids) if role is not None]
 
     @property
     def name(self) -> str:
@@ -316,7 +378,7 @@ class GuildMember(BaseModel, Comparable):
         -------
         :class:`builtins.bool`
         """
-        return self.premium_since is not None
+        return self._premium_since is not None
 
     def is_timed_out(self) -> bool:
         """Checks whether the member is timed out.
@@ -325,11 +387,7 @@ class GuildMember(BaseModel, Comparable):
         -------
         :class:`builtins.bool`
         """
-        timeout_until = self.timeout_until
-        if timeout_until is None:
-            return False
-        now = datetime.now()
-        return now < timeout_until
+        return time.time() < self._timeout_until_ts
 
     def permissions(self) -> Permissions:
         """Computes the permissions for this member in the parent guild.
@@ -579,7 +637,7 @@ class GuildMember(BaseModel, Comparable):
             return self.roles
 
         ret: typing.List[Role] = []
-        existing_roles = self.role_ids
+        existing_roles = frozenset(self.role_ids)
 
         rest = self.guild._rest
         guild_id = self.guild.id
@@ -645,7 +703,7 @@ class GuildMember(BaseModel, Comparable):
             return self.roles
 
         ret: typing.List[Role] = []
-        existing_roles = self.role_ids
+        existing_roles = frozenset(self.role_ids)
 
         rest = self.guild._rest
         guild_id = self.guild.id
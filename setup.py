@@ -39,6 +39,9 @@ setup(
     long_description_content_type="text/markdown",
     include_package_data=True,
     install_requires=REQUIREMENTS,
+    extras_require={
+        "speed": ["uvloop; sys_platform != 'win32'"],
+    },
     packages=PACKAGES,
     python_requires='>=3.8.0',
     classifiers=[
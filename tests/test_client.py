@@ -0,0 +1,185 @@
+"""Tests for qord.Client"""
+
+from qord import Client, events
+import asyncio
+import sys
+import unittest
+
+
+class TestClient(unittest.TestCase):
+    def test_invoke_event_waiters(self) -> None:
+        async def main():
+            client = Client()
+            first = asyncio.ensure_future(client.wait_for_event("ready"))
+            second = asyncio.ensure_future(client.wait_for_event("ready"))
+            await asyncio.sleep(0)
+
+            event = events.Ready()
+            client.invoke_event(event)
+
+            assert await asyncio.wait_for(first, timeout=1) is event
+            assert await asyncio.wait_for(second, timeout=1) is event
+
+        asyncio.run(main())
+
+    def test_invoke_event_failing_check(self) -> None:
+        async def main():
+            client = Client()
+            received = []
+
+            async def listener(event):
+                received.append(event)
+
+            def check(event):
+                raise RuntimeError
+
+            client.register_event_listener("ready", listener)
+            waiter = asyncio.ensure_future(client.wait_for_event("ready", check=check))
+            await asyncio.sleep(0)
+
+            event = events.Ready()
+            with self.assertRaises(RuntimeError):
+                client.invoke_event(event)
+
+            # Listeners are still called
+            await asyncio.sleep(0)
+            assert received == [event]
+            waiter.cancel()
+
+        asyncio.run(main())
+
+    @unittest.skipUnless(hasattr(asyncio, "eager_task_factory"), "requires eager tasks (Python 3.12+)")
+    def test_invoke_event_eager_tasks(self) -> None:
+        async def main():
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory) # type: ignore
+            client = Client()
+            received = []
+
+            async def listener(event):
+                # Registered before the first suspension, must not
+                # receive the event that invoked this listener.
+                waiter = client.wait_for_event("ready", timeout=0.1)
+                try:
+                    received.append(await waiter)
+                except asyncio.TimeoutError:
+                    received.append(None)
+
+            client.register_event_listener("ready", listener)
+            client.invoke_event(events.Ready())
+            await asyncio.sleep(0.2)
+
+            assert received == [None]
+
+        asyncio.run(main())
+
+    def test_has_listeners(self) -> None:
+        async def main():
+            client = Client()
+            assert not client.has_listeners("ready")
+
+            async def listener(event):
+                pass
+
+            client.register_event_listener("ready", listener)
+            assert client.has_listeners("ready")
+
+            waiter = asyncio.ensure_future(client.wait_for_event("resumed"))
+            await asyncio.sleep(0)
+            assert client.has_listeners("resumed")
+
+            client.invoke_event(events.Resumed(shard=None))
+            await waiter
+            assert not client.has_listeners("resumed")
+
+        asyncio.run(main())
+
+    def test_dispatch_invoke(self) -> None:
+        async def main():
+            client = Client()
+            dispatch = client._dispatch
+            invoked = []
+            received = []
+
+            async def listener(event):
+                received.append(event)
+
+            # Record the events actually passed to invoke_event()
+            def invoke_event(event):
+                invoked.append(event)
+                client.invoke_event(event)
+
+            dispatch._invoke = invoke_event
+            client.register_event_listener("ready", listener)
+
+            ready = events.Ready()
+            resumed = events.Resumed(shard=None)
+
+            # Unlistened events are skipped
+            dispatch.invoke(resumed)
+            assert invoked == []
+
+            # Listeners and waiters still fire
+            waiter = asyncio.ensure_future(client.wait_for_event("resumed"))
+            await asyncio.sleep(0)
+            dispatch.invoke(ready)
+            dispatch.invoke(resumed)
+            await asyncio.sleep(0)
+
+            assert invoked == [ready, resumed]
+            assert received == [ready]
+            assert await waiter is resumed
+
+        asyncio.run(main())
+
+    def test_dispatch_invoke_overridden(self) -> None:
+        invoked = []
+
+        class _Client(Client):
+            def invoke_event(self, event, /) -> None:
+                invoked.append(event)
+                super().invoke_event(event)
+
+        async def main():
+            client = _Client()
+            event = events.Ready()
+            client._dispatch.invoke(event)
+            assert invoked == [event]
+
+        asyncio.run(main())
+
+    @unittest.skipIf(sys.version_info < (3, 10), "loop_factory requires Python 3.10+")
+    def test_start_loop_factory(self) -> None:
+        loops = []
+
+        def loop_factory():
+            loop = asyncio.new_event_loop()
+            loops.append(loop)
+            return loop
+
+        class _Client(Client):
+            async def setup(self, token: str, /) -> None:
+                loop = asyncio.get_running_loop()
+                assert loop is loops[0]
+
+                if hasattr(asyncio, "eager_task_factory"):
+                    assert loop.get_task_factory() is asyncio.eager_task_factory # type: ignore
+
+            async def launch(self) -> None:
+                # Exercises the asyncio primitives created in Client.__init__
+                handler = self._rest.ratelimit_handler
+                handler.set_global()
+                asyncio.get_running_loop().call_soon(handler.reset_global)
+                await handler.wait_until_global_reset()
+                self._notify_shards_launch()
+                await self._dispatch._prepare_ready()
+
+        client = _Client(loop_factory=loop_factory, ready_timeout=0.01)
+        client.start("token")
+
+        assert len(loops) == 1
+        assert loops[0].is_closed()
+        assert client.is_ready()
+
+
+if __name__ == "__main__":
+    unittest.main()
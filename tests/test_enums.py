@@ -0,0 +1,30 @@
+"""Tests for qord.enums"""
+
+from qord.enums import ChannelType, DefaultAvatar, EventStatus, GatewayEvent, ImageExtension
+
+import unittest
+
+class TestEnums(unittest.TestCase):
+    def test_members(self) -> None:
+        assert len(list(DefaultAvatar)) == 6
+
+        # INDEX is a plain class attribute, not an alias member
+        assert type(DefaultAvatar.INDEX) is int
+        assert DefaultAvatar.INDEX == DefaultAvatar.PINK
+        assert "INDEX" not in DefaultAvatar.__members__
+
+        # No value is aliased to another member
+        assert len(list(EventStatus)) == len(EventStatus.__members__)
+        assert EventStatus.CANCELED == 4
+
+    def test_values(self) -> None:
+        assert {"ready": 1}[GatewayEvent.READY] == 1
+        assert GatewayEvent.READY == "ready"
+        assert {0: "text"}[ChannelType.TEXT] == "text"
+
+        assert f"{ImageExtension.PNG}" == "png"
+        assert "avatar.{}".format(ImageExtension.WEBP) == "avatar.webp"
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,21 @@
+"""Tests for qord.events"""
+
+from qord import events
+import importlib
+import unittest
+
+
+class TestEvents(unittest.TestCase):
+    def test_lazy_events(self) -> None:
+        for module, names in events._LAZY_EVENTS.items():
+            module = importlib.import_module(f"qord.events.{module}")
+
+            assert set(names) == set(module.__all__)
+
+            for name in names:
+                assert name in events.__all__
+                assert getattr(events, name) is getattr(module, name)
+
+
+if __name__ == "__main__":
+    unittest.main()
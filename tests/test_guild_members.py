@@ -0,0 +1,98 @@
+"""Tests for qord.GuildMember"""
+
+from qord import Client, Guild, GuildMember, Role
+from datetime import datetime, timedelta, timezone
+import unittest
+
+
+def _role_payload(role_id: int) -> dict:
+    return {
+        "id": str(role_id),
+        "name": f"role-{role_id}",
+        "permissions": "0",
+        "position": 0,
+        "color": 0,
+        "hoist": False,
+        "managed": False,
+        "mentionable": False,
+    }
+
+def _member_payload(**fields) -> dict:
+    data = {
+        "user": {"id": "10", "username": "user", "discriminator": "0001", "avatar": None},
+        "joined_at": "2022-03-27T15:07:43.000000+00:00",
+        "roles": [],
+    }
+    data.update(fields)
+    return data
+
+
+class TestGuildMember(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = Client()
+        self.guild = Guild({
+            "id": "1",
+            "name": "guild",
+            "owner_id": "2",
+            "features": [],
+            "roles": [_role_payload(1), _role_payload(5)],
+        }, client=self.client)
+
+    def test_is_timed_out(self) -> None:
+        member = GuildMember(_member_payload(), guild=self.guild)
+        assert member.timeout_until is None
+        assert not member.is_timed_out()
+
+        future = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+        member = GuildMember(_member_payload(communication_disabled_until=future), guild=self.guild)
+        assert member.is_timed_out()
+
+        past = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+        member = GuildMember(_member_payload(communication_disabled_until=past), guild=self.guild)
+        assert member.timeout_until is not None
+        assert not member.is_timed_out()
+
+    def test_roles(self) -> None:
+        member = GuildMember(_member_payload(roles=["5", "7"]), guild=self.guild)
+
+        assert member.role_ids == (5, 7)
+        assert isinstance(member.role_ids, tuple)
+
+        # Roles not in cache are not included
+        assert [role.id for role in member.roles] == [5]
+
+        # Roles are resolved upon access
+        self.guild._cache.add_role(Role(_role_payload(7), guild=self.guild))
+        assert [role.id for role in member.roles] == [5, 7]
+
+    def test_timestamps(self) -> None:
+        member = GuildMember(_member_payload(), guild=self.guild)
+
+        # Timestamps are parsed upon access
+        assert member._joined_at == "2022-03-27T15:07:43.000000+00:00"
+
+        joined_at = datetime(2022, 3, 27, 15, 7, 43, tzinfo=timezone.utc)
+        assert member.joined_at == joined_at
+        assert member.joined_at is member.joined_at
+        assert member.premium_since is None
+        assert not member.is_boosting()
+
+        member = GuildMember(_member_payload(premium_since="2022-03-27T15:07:43Z"), guild=self.guild)
+        assert member.premium_since == joined_at
+        assert member.premium_since is member.premium_since
+        assert member.is_boosting()
+
+    def test_cached_user(self) -> None:
+        member = GuildMember(_member_payload(), guild=self.guild)
+        self.client._cache.add_user(member.user)
+
+        data = _member_payload()
+        data["user"] = dict(data["user"], username="new")
+        other = GuildMember(data, guild=self.guild)
+
+        assert other.user is member.user
+        assert member.user.name == "new"
+
+
+if __name__ == "__main__":
+    unittest.main()
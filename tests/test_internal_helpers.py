@@ -8,3 +8,9 @@ class TestInternalHelpers(unittest.TestCase):
         creation_time = datetime.datetime(2016, 4, 30, 11, 18, 25, 796000, datetime.timezone.utc)
 
         assert helpers.compute_creation_time(snowflake) == creation_time
+
+    def test_parse_iso_timestamp(self) -> None:
+        timestamp = datetime.datetime(2022, 3, 27, 15, 7, 43, tzinfo=datetime.timezone.utc)
+
+        assert helpers.parse_iso_timestamp("2022-03-27T15:07:43+00:00") == timestamp
+        assert helpers.parse_iso_timestamp("2022-03-27T15:07:43Z") == timestamp
@@ -0,0 +1,45 @@
+"""Tests for qord.core.ratelimits"""
+
+from qord.core.ratelimits import REST_BASE_URL, Route, RatelimitHandler
+import unittest
+
+
+class TestRoute(unittest.TestCase):
+    def test_url(self) -> None:
+        route = Route("GET", "/guilds/{guild_id}/members/{user_id}", guild_id=1234, user_id=5678)
+        assert route.url == REST_BASE_URL + "/guilds/1234/members/5678"
+
+        route = Route("GET", "/gateway", requires_auth=False)
+        assert route.url == REST_BASE_URL + "/gateway"
+
+    def test_ratelimit_path(self) -> None:
+        route = Route("PATCH", "/channels/{channel_id}", channel_id=1234)
+        assert route.ratelimit_path == "PATCH-/channels/{channel_id}-None:1234"
+
+        route = Route("GET", "/users/{user_id}", user_id=1234)
+        assert route.ratelimit_path == "GET-/users/{user_id}"
+
+
+class TestRatelimitHandler(unittest.TestCase):
+    def test_locks(self) -> None:
+        handler = RatelimitHandler()
+
+        lock = handler.get_lock("GET-/users/@me-None:None")
+        assert handler.get_lock("GET-/users/@me-None:None") is lock
+
+        handler.set_bucket("GET-/users/@me-None:None", "abcd")
+        assert handler.get_lock("GET-/users/@me-None:None") is lock
+
+        # Routes sharing a bucket hash share the lock
+        other = handler.get_lock("PATCH-/users/@me-None:None")
+        assert other is not lock
+
+        handler.set_bucket("PATCH-/users/@me-None:None", "abcd")
+        assert handler.get_lock("PATCH-/users/@me-None:None") is lock
+
+        handler.clear()
+        assert handler.get_lock("GET-/users/@me-None:None") is not lock
+
+
+if __name__ == "__main__":
+    unittest.main()